@@ -1,15 +1,29 @@
+import importlib.util
+import numpy as np
 import pandas as pd
-from typing import List, Dict
+from functools import reduce
+from typing import List, Dict, Optional
+
+CSV_ENGINE = "pyarrow" if importlib.util.find_spec("pyarrow") is not None else "c"
+
+PRICE_COLS = ["open", "high", "low", "close"]
 
 class DataLoader:
-    def __init__(self, base_path: str = "../data"):
+    def __init__(self, base_path: str = "../data", float_dtype: str = "float64", timestamp_unit: Optional[str] = None):
         self.base_path = base_path
+        self.float_dtype = float_dtype
+        self.timestamp_unit = timestamp_unit
         self.data: Dict[str, pd.DataFrame] = {}
+        self.arrays: Dict[str, Dict[str, np.ndarray]] = {}
 
     def load_symbol(self, symbol: str, file_type: str = "csv") -> pd.DataFrame:
         path = f"{self.base_path}/{symbol}.{file_type}"
         if file_type == "csv":
-            df = pd.read_csv(path)
+            try:
+                df = pd.read_csv(path, engine=CSV_ENGINE)
+            except ImportError:
+                # pyarrow is installed but older than pandas' pyarrow engine requires
+                df = pd.read_csv(path)
         elif file_type in ("parquet", "pq"):
             df = pd.read_parquet(path)
         else:
@@ -21,9 +35,20 @@ class DataLoader:
         if not all(col in df.columns for col in required_cols):
             raise ValueError(f"{symbol} file missing required OHLCV columns: {required_cols}")
 
+        # Prices are float64 by default; float_dtype="float32" halves their memory
+        # but keeps only ~7 significant digits. Volume is left as loaded.
+        df[PRICE_COLS] = df[PRICE_COLS].astype(self.float_dtype)
+
+        # Parse timestamps once here so downstream code never re-parses them.
+        # Numeric epochs are read as nanoseconds unless timestamp_unit says otherwise
+        # (e.g. "ms" for raw Binance klines).
+        ts = pd.to_datetime(df["timestamp"], unit=self.timestamp_unit)
+        df["timestamp"] = ts.dt.as_unit("ns")
+
         # Sort and reset index
         df = df.sort_values("timestamp").reset_index(drop=True)
         self.data[symbol] = df
+        self.arrays.pop(symbol, None)
         return df
 
     def load_symbols(self, symbols: List[str], file_type: str = "csv") -> Dict[str, pd.DataFrame]:
@@ -34,13 +59,37 @@ class DataLoader:
             raise KeyError(f"No data loaded for symbol {symbol}")
         return self.data[symbol]
 
+    def get_arrays(self, symbol: str) -> Dict[str, np.ndarray]:
+        # Per-column views of the loaded frame (no copies, loaded dtypes) for
+        # positional access in hot loops instead of going through df.iloc per row.
+        # Timestamps come back as datetime64[ns]; tz-aware columns as UTC instants.
+        if symbol not in self.arrays:
+            df = self.get_data(symbol)
+            self.arrays[symbol] = {
+                "ts": df["timestamp"].to_numpy("datetime64[ns]"),
+                "o": df["open"].to_numpy(),
+                "h": df["high"].to_numpy(),
+                "l": df["low"].to_numpy(),
+                "c": df["close"].to_numpy(),
+                "v": df["volume"].to_numpy() if "volume" in df else np.zeros(len(df)),
+            }
+        return self.arrays[symbol]
+
     def align_timestamps(self) -> pd.DataFrame:
-        dfs = []
-        for symbol, df in self.data.items():
-            temp = df[["timestamp", "close"]].rename(columns={"close": symbol})
-            temp["timestamp"] = pd.to_datetime(temp["timestamp"])
-            dfs.append(temp.set_index("timestamp"))
+        if not self.data:
+            raise ValueError("No data loaded to align")
+
+        symbols = list(self.data)
+        indexes = [pd.DatetimeIndex(df["timestamp"].to_numpy()) for df in self.data.values()]
+
+        # Build the union index once and reindex each close series onto it
+        union = reduce(lambda a, b: a.union(b), indexes)
+        closes = {
+            symbol: pd.Series(df["close"].to_numpy(), index=index).reindex(union)
+            for symbol, df, index in zip(symbols, self.data.values(), indexes)
+        }
 
-        combined = pd.concat(dfs, axis=1).sort_index()
+        combined = pd.DataFrame(closes, index=union, copy=False)
+        combined.index.name = "timestamp"
         combined = combined.ffill().bfill()
         return combined
@@ -0,0 +1,248 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtester import data_loader
+from backtester.data_loader import DataLoader
+
+
+def write_csv(path, symbol, **columns):
+    pd.DataFrame(columns).to_csv(path / f"{symbol}.csv", index=False)
+
+
+@pytest.fixture
+def btc_dir(tmp_path):
+    write_csv(
+        tmp_path,
+        "BTCUSDT",
+        timestamp=["2024-01-01 00:01:00", "2024-01-01 00:00:00"],
+        open=[67200.01, 67100.02],
+        high=[67250.5, 67210.0],
+        low=[67150.25, 67090.75],
+        close=[67200.03, 67199.99],
+        volume=[123456789.123, 987.654],
+    )
+    return tmp_path
+
+
+def test_load_symbol_keeps_float64_precision(btc_dir):
+    df = DataLoader(str(btc_dir)).load_symbol("BTCUSDT")
+
+    assert df["open"].dtype == np.float64
+    assert df["open"].tolist() == [67100.02, 67200.01]
+    assert df["close"].tolist() == [67199.99, 67200.03]
+    assert df["volume"].dtype == np.float64
+    assert df["volume"].tolist() == [987.654, 123456789.123]
+
+
+def test_load_symbol_float32_opt_in_leaves_volume(btc_dir):
+    df = DataLoader(str(btc_dir), float_dtype="float32").load_symbol("BTCUSDT")
+
+    assert all(df[col].dtype == np.float32 for col in ["open", "high", "low", "close"])
+    assert df["volume"].dtype == np.float64
+    assert df["volume"].iloc[1] == 123456789.123
+
+
+@pytest.mark.parametrize("suffix", ["", "Z"])
+def test_get_arrays_are_views_at_loaded_dtype(tmp_path, suffix):
+    write_csv(
+        tmp_path,
+        "BTCUSDT",
+        timestamp=[f"2024-01-01T00:01:00{suffix}", f"2024-01-01T00:00:00{suffix}"],
+        open=[67200.01, 67100.02],
+        high=[67250.5, 67210.0],
+        low=[67150.25, 67090.75],
+        close=[67200.03, 67199.99],
+        volume=[123456789.123, 987.654],
+    )
+    loader = DataLoader(str(tmp_path), float_dtype="float32")
+    df = loader.load_symbol("BTCUSDT")
+    arrays = loader.get_arrays("BTCUSDT")
+
+    assert (df["timestamp"].dt.tz is not None) == bool(suffix)
+    assert arrays["ts"].dtype == np.dtype("datetime64[ns]")
+    assert arrays["ts"].tolist() == [1704067200 * 10**9, 1704067260 * 10**9]
+    assert all(arrays[key].dtype == np.float32 for key in ["o", "h", "l", "c"])
+    assert arrays["v"].dtype == np.float64
+    assert np.shares_memory(arrays["ts"], df["timestamp"].values)
+    for key, col in [("o", "open"), ("c", "close"), ("v", "volume")]:
+        assert np.shares_memory(arrays[key], df[col].to_numpy())
+
+
+def test_get_arrays_without_volume(tmp_path):
+    write_csv(tmp_path, "ETHUSDT", timestamp=["2024-01-01"], open=[1.0], high=[1.0], low=[1.0], close=[1.0])
+    loader = DataLoader(str(tmp_path))
+    loader.load_symbol("ETHUSDT")
+
+    assert loader.get_arrays("ETHUSDT")["v"].tolist() == [0.0]
+
+
+def test_get_arrays_cache_cleared_on_reload(btc_dir):
+    loader = DataLoader(str(btc_dir))
+    loader.load_symbol("BTCUSDT")
+    first = loader.get_arrays("BTCUSDT")
+    assert loader.get_arrays("BTCUSDT") is first
+
+    write_csv(btc_dir, "BTCUSDT", timestamp=["2024-01-02"], open=[1.0], high=[2.0], low=[0.5], close=[1.5])
+    loader.load_symbol("BTCUSDT")
+    second = loader.get_arrays("BTCUSDT")
+
+    assert second is not first
+    assert second["c"].tolist() == [1.5]
+
+
+def test_get_arrays_unknown_symbol(btc_dir):
+    with pytest.raises(KeyError):
+        DataLoader(str(btc_dir)).get_arrays("BTCUSDT")
+
+
+@pytest.mark.parametrize("engine", ["pyarrow", "c"])
+def test_load_symbol_csv_engines_agree(btc_dir, monkeypatch, engine):
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    monkeypatch.setattr(data_loader, "CSV_ENGINE", engine)
+    df = DataLoader(str(btc_dir)).load_symbol("BTCUSDT")
+
+    assert df["timestamp"].tolist() == [pd.Timestamp("2024-01-01 00:00"), pd.Timestamp("2024-01-01 00:01")]
+    assert df["close"].tolist() == [67199.99, 67200.03]
+
+
+def test_load_symbol_falls_back_when_pyarrow_engine_unusable(btc_dir, monkeypatch):
+    read_csv = pd.read_csv
+
+    def fake_read_csv(path, engine=None, **kwargs):
+        if engine == "pyarrow":
+            raise ImportError("pyarrow too old")
+        return read_csv(path, **kwargs)
+
+    monkeypatch.setattr(data_loader, "CSV_ENGINE", "pyarrow")
+    monkeypatch.setattr(data_loader.pd, "read_csv", fake_read_csv)
+    df = DataLoader(str(btc_dir)).load_symbol("BTCUSDT")
+
+    assert df["close"].tolist() == [67199.99, 67200.03]
+
+
+def test_load_symbol_parses_and_sorts_string_timestamps(tmp_path):
+    write_csv(
+        tmp_path,
+        "SOLUSDT",
+        timestamp=["2024-01-01 10:00:00", "2023-12-31 23:59:00"],
+        open=[1.0, 2.0],
+        high=[1.0, 2.0],
+        low=[1.0, 2.0],
+        close=[1.0, 2.0],
+    )
+    df = DataLoader(str(tmp_path)).load_symbol("SOLUSDT")
+
+    assert df["timestamp"].dtype == np.dtype("datetime64[ns]")
+    assert df["timestamp"].tolist() == [pd.Timestamp("2023-12-31 23:59"), pd.Timestamp("2024-01-01 10:00")]
+    assert df["close"].tolist() == [2.0, 1.0]
+
+
+def write_frame(path, symbol, file_type, timestamps):
+    df = pd.DataFrame(
+        {
+            "timestamp": timestamps,
+            "open": [1.0, 2.0],
+            "high": [1.0, 2.0],
+            "low": [1.0, 2.0],
+            "close": [1.0, 2.0],
+        }
+    )
+    if file_type == "csv":
+        df.to_csv(path / f"{symbol}.csv", index=False)
+    else:
+        pytest.importorskip("pyarrow")
+        df.to_parquet(path / f"{symbol}.parquet")
+
+
+@pytest.mark.parametrize(
+    "unit, timestamps",
+    [
+        (None, [1704067260000000000, 1704067200000000000]),
+        ("ns", [1704067260000000000, 1704067200000000000]),
+        ("us", [1704067260000000, 1704067200000000]),
+        ("ms", [1704067260000, 1704067200000]),
+        ("s", [1704067260, 1704067200]),
+    ],
+)
+@pytest.mark.parametrize("file_type", ["csv", "parquet"])
+def test_load_symbol_reads_numeric_epochs(tmp_path, file_type, unit, timestamps):
+    write_frame(tmp_path, "XRPUSDT", file_type, timestamps)
+    loaded = DataLoader(str(tmp_path), timestamp_unit=unit).load_symbol("XRPUSDT", file_type)
+
+    assert loaded["timestamp"].dtype == np.dtype("datetime64[ns]")
+    assert loaded["timestamp"].tolist() == [pd.Timestamp("2024-01-01 00:00"), pd.Timestamp("2024-01-01 00:01")]
+
+
+@pytest.mark.parametrize("engine", ["pyarrow", "c"])
+@pytest.mark.parametrize("suffix", ["Z", "+00:00"])
+def test_load_symbol_keeps_tz_aware_csv_timestamps(tmp_path, monkeypatch, engine, suffix):
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    monkeypatch.setattr(data_loader, "CSV_ENGINE", engine)
+    write_frame(tmp_path, "XRPUSDT", "csv", [f"2024-01-01T00:01:00{suffix}", f"2024-01-01T00:00:00{suffix}"])
+    loaded = DataLoader(str(tmp_path)).load_symbol("XRPUSDT")
+
+    assert loaded["timestamp"].dtype == pd.DatetimeTZDtype("ns", "UTC")
+    assert loaded["timestamp"].tolist() == [
+        pd.Timestamp("2024-01-01 00:00", tz="UTC"),
+        pd.Timestamp("2024-01-01 00:01", tz="UTC"),
+    ]
+
+
+def test_load_symbol_keeps_tz_aware_parquet_timestamps(tmp_path):
+    timestamps = pd.to_datetime(["2024-01-01 00:01", "2024-01-01 00:00"]).tz_localize("UTC")
+    write_frame(tmp_path, "XRPUSDT", "parquet", timestamps)
+    loaded = DataLoader(str(tmp_path)).load_symbol("XRPUSDT", "parquet")
+
+    assert loaded["timestamp"].dtype == pd.DatetimeTZDtype("ns", "UTC")
+    assert loaded["timestamp"].tolist() == [
+        pd.Timestamp("2024-01-01 00:00", tz="UTC"),
+        pd.Timestamp("2024-01-01 00:01", tz="UTC"),
+    ]
+
+
+def baseline_align_timestamps(data):
+    dfs = []
+    for symbol, df in data.items():
+        temp = df[["timestamp", "close"]].rename(columns={"close": symbol})
+        temp["timestamp"] = pd.to_datetime(temp["timestamp"])
+        dfs.append(temp.set_index("timestamp"))
+
+    combined = pd.concat(dfs, axis=1, sort=True).sort_index()
+    return combined.ffill().bfill()
+
+
+def test_align_timestamps_matches_baseline(tmp_path):
+    write_csv(
+        tmp_path,
+        "AUSDT",
+        timestamp=["2024-01-01 00:03:00", "2024-01-01 00:01:00", "2024-01-01 00:02:00"],
+        open=[1.0, 1.0, 1.0],
+        high=[1.0, 1.0, 1.0],
+        low=[1.0, 1.0, 1.0],
+        close=[3.0, 1.0, 2.0],
+    )
+    write_csv(
+        tmp_path,
+        "BUSDT",
+        timestamp=["2024-01-01 00:00:00", "2024-01-01 00:02:00", "2024-01-01 00:04:00"],
+        open=[1.0, 1.0, 1.0],
+        high=[1.0, 1.0, 1.0],
+        low=[1.0, 1.0, 1.0],
+        close=[10.0, 20.0, 40.0],
+    )
+    loader = DataLoader(str(tmp_path))
+    loader.load_symbols(["AUSDT", "BUSDT"])
+    aligned = loader.align_timestamps()
+
+    pd.testing.assert_frame_equal(aligned, baseline_align_timestamps(loader.data), check_freq=False)
+    assert aligned.index.name == "timestamp"
+    assert aligned["AUSDT"].tolist() == [1.0, 1.0, 2.0, 3.0, 3.0]
+    assert aligned["BUSDT"].tolist() == [10.0, 10.0, 20.0, 20.0, 40.0]
+
+
+def test_align_timestamps_without_data():
+    with pytest.raises(ValueError):
+        DataLoader().align_timestamps()